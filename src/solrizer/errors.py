@@ -108,6 +108,22 @@ class ConfigurationError(ProblemDetailError, InternalServerError):
     description = 'The server is incorrectly configured.'
 
 
+class DocumentSerializationError(ProblemDetailError, InternalServerError):
+    """The index document could not be serialized as JSON. For example, it
+    may contain an integer that exceeds the 64-bit range.
+
+    The HTTP status is `500 Internal Server Error`.
+
+    Must provide a `uri` parameter to the constructor:
+
+    ```python
+    raise DocumentSerializationError(uri='http://example.com/foo')
+    ```
+    """
+    name = 'Document serialization error'
+    description = 'The index document for "{uri}" could not be serialized as JSON.'
+
+
 def problem_detail_response(e: ProblemDetailError) -> Response:
     """Return a JSON Problem Detail ([RFC 9457](https://www.rfc-editor.org/rfc/rfc9457))
     for HTTP errors.
@@ -5,6 +5,12 @@ Indexer implementation function: `content_model_fields()`
 
 Prerequisites: None
 
+Settings:
+
+* **`read_workers`** Maximum number of threads used to concurrently read
+  linked resources from the repository. Defaults to `1`, which reads them
+  one at a time. Concurrent reads share the repository client's HTTP session.
+
 Output fields:
 
 | Field                       | Python Type | Solr Type |
@@ -37,18 +43,24 @@ Output field patterns:
 """
 
 import logging
-from collections.abc import Iterator, Iterable, Callable
-from typing import NamedTuple
+from collections.abc import Iterator, Iterable, Callable, Mapping, MutableMapping
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Literal as LiteralType
+from weakref import WeakKeyDictionary
 
 from langcodes import standardize_tag, LanguageTagError
 from plastron.models import ContentModeledResource
 from plastron.namespaces import xsd, umdtype, namespace_manager
+from plastron.rdfmapping.descriptors import DataProperty, ObjectProperty
+from plastron.rdfmapping.graph import TrackChangesGraph, copy_triples
 from plastron.rdfmapping.properties import RDFDataProperty, RDFObjectProperty, RDFProperty
 from plastron.rdfmapping.resources import RDFResource, RDFResourceBase
-from plastron.repo import Repository
+from plastron.repo import Repository, RepositoryResource
 from plastron.validation.vocabularies import VocabularyTerm
 from rdflib import Literal, URIRef
-from urlobject import URLObject
 
 from solrizer.indexers import SolrFields, IndexerContext, IndexerError
 from solrizer.indexers.utils import solr_datetime
@@ -56,10 +68,12 @@ from solrizer.indexers.utils import solr_datetime
 logger = logging.getLogger(__name__)
 
 
-class Suffix(NamedTuple):
+@dataclass(frozen=True, slots=True)
+class Suffix:
     """Encapsulates a suffix that encodes the field type, plurality (i.e., is it
     a multivalued field or not), and language tag. Stringifies to the `base` value,
-    plus "s" if `plural`, plus the `lang` value.
+    plus "s" if `plural`, plus the `lang` value. The string form is computed once,
+    when the suffix is created.
 
     ```pycon
     >>> str(Suffix('__str'))
@@ -83,9 +97,44 @@ class Suffix(NamedTuple):
     """Whether this field is multivalued."""
     lang: str = ''
     """Optional language tag. Should begin with a separator like "_"."""
+    _str: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, '_str', self.base + ('s' if self.plural else '') + self.lang)
 
     def __str__(self):
-        return self.base + ('s' if self.plural else '') + self.lang
+        return self._str
+
+
+@lru_cache(maxsize=256)
+def get_suffix(base: str, plural: bool = False, lang: str = '') -> Suffix:
+    """Returns a shared `Suffix` instance for the given arguments. Since
+    `Suffix` objects are immutable, the same instance is reused for every
+    field with the same suffix. Like `language_suffix()`, the cache is
+    bounded, since the `lang` values come from repository data.
+
+    ```pycon
+    >>> get_suffix('__txt', plural=True) is get_suffix('__txt', plural=True)
+    True
+
+    ```
+    """
+    return Suffix(base, plural, lang)
+
+
+@dataclass(frozen=True, slots=True)
+class FieldPlan:
+    """Precomputed instructions for indexing a single RDF property of a
+    particular model class. See `get_field_plans()`."""
+
+    attr_name: str
+    """Name of the property attribute on the model class."""
+    kind: LiteralType['data', 'text', 'object']
+    """How to index the property: "data" uses `get_field()` with the
+    `field_arguments`, "text" uses `get_text_fields()`, and "object" uses
+    `get_object_fields()`."""
+    field_arguments: dict[str, Any] = field(default_factory=dict)
+    """Keyword arguments for `get_field()`, for "data" properties."""
 
 
 FIELD_ARGUMENTS_BY_DATATYPE = {
@@ -119,53 +168,258 @@ SKIP_FIELDS_BY_MODEL = {
 }
 """Field names that should be skipped for each model."""
 
+DEFAULT_READ_WORKERS = 1
+"""Default value for the `read_workers` setting. See `get_read_workers()`."""
+
+_standardize_tag = lru_cache(maxsize=256)(standardize_tag)
+"""Memoized version of `langcodes.standardize_tag()`. The set of distinct
+language tags in a corpus is small, so most lookups are cache hits."""
+
 
 def content_model_fields(ctx: IndexerContext) -> SolrFields:
     """Indexer function that adds fields generated from the indexed
     resource's content model. Registered as the entry point
-    *content_model* in the `solrizer_indexers` entry point group."""
-    return get_model_fields(ctx.obj, repo=ctx.repo, prefix='object__')
+    *content_model* in the `solrizer_indexers` entry point group.
+
+    A fresh resource cache is used for each call, so repository resources
+    are read at most once per indexed resource, and nothing is retained
+    between requests. Likewise, if the `read_workers` setting is greater
+    than 1, a single executor with that many threads is used for all the
+    repository reads of the call. Documents are always built on the calling
+    thread.
+
+    Raises an `IndexerError` if `read_workers` is not a positive integer."""
+    read_workers = get_read_workers(ctx.settings or {})
+    with ThreadPoolExecutor(max_workers=read_workers) if read_workers > 1 else nullcontext() as executor:
+        return get_model_fields(
+            ctx.obj,
+            repo=ctx.repo,
+            prefix='object__',
+            resource_cache={},
+            executor=executor,
+        )
+
+
+def get_read_workers(settings: Mapping[str, Any]) -> int:
+    """Returns the `read_workers` value from the indexer `settings`, or
+    `DEFAULT_READ_WORKERS` if it is not set.
+
+    ```pycon
+    >>> get_read_workers({})
+    1
 
+    >>> get_read_workers({'read_workers': '4'})
+    4
 
-def get_model_fields(obj: RDFResourceBase, repo: Repository, prefix: str = '') -> SolrFields:
+    ```
+    """
+    value = settings.get('read_workers', DEFAULT_READ_WORKERS)
+    try:
+        read_workers = int(value)
+    except (TypeError, ValueError):
+        read_workers = 0
+    if read_workers < 1:
+        raise IndexerError(f'Setting "read_workers" must be a positive integer, not "{value}"')
+    return read_workers
+
+
+def read_resource(
+    repo: Repository,
+    uri: str,
+    resource_cache: MutableMapping[str, RepositoryResource] = None,
+) -> RepositoryResource:
+    """Read the resource at `uri` from `repo`. If a `resource_cache` is given,
+    return the previously read resource for `uri` from it when present, and
+    otherwise add the newly read resource to it. The same cache also holds the
+    descriptions of those resources; see `describe_resource()`."""
+    if resource_cache is None:
+        return repo[uri].read()
+    key = str(uri)
+    try:
+        return resource_cache[key]
+    except KeyError:
+        resource = resource_cache[key] = repo[uri].read()
+        return resource
+
+
+def describe_resource[T: RDFResourceBase](
+    resource: RepositoryResource,
+    object_class: type[T],
+    resource_cache: MutableMapping = None,
+) -> T:
+    """Returns `resource` described using `object_class`.
+
+    If a `resource_cache` is given, the descriptions of each resource are
+    memoized in it, per `object_class`, under the key `(uri, 'descriptions')`.
+    Creating a model object adds the default triples of its class (e.g., its
+    RDF types) to the graph it is given, so only the first description of a
+    cached resource uses the resource's own graph. Descriptions using any
+    other class are created on a copy of the graph as originally read."""
+    if resource_cache is None:
+        return resource.describe(object_class)
+    descriptions = resource_cache.setdefault((str(resource.url), 'descriptions'), {})
+    try:
+        return descriptions[object_class]
+    except KeyError:
+        pass
+    if not descriptions:
+        obj = resource.describe(object_class)
+    else:
+        graph = TrackChangesGraph()
+        copy_triples(resource.graph.original, graph)
+        obj = object_class(uri=URIRef(resource.url), graph=graph)
+    descriptions[object_class] = obj
+    return obj
+
+
+def read_resources(
+    repo: Repository,
+    uris: Iterable[str],
+    resource_cache: MutableMapping[str, RepositoryResource] = None,
+    executor: Executor = None,
+) -> dict[str, RepositoryResource]:
+    """Read the resources at each of the `uris` from `repo`, and return a
+    dictionary mapping each URI (as a string) to its resource.
+
+    Each read is a separate HTTP request to the repository, so if an `executor`
+    is given, any resources not already in the `resource_cache` are read
+    concurrently by submitting them to it. Otherwise, they are read one at a
+    time. Newly read resources are added to the `resource_cache`, if one is
+    given.
+
+    Note that concurrent reads all go through the HTTP session of the
+    `repo` client, so the `executor` should only have a few workers."""
+    if resource_cache is None:
+        resource_cache = {}
+    uris = {str(uri): uri for uri in uris}
+    uncached = [key for key in uris if key not in resource_cache]
+    if executor is not None and len(uncached) > 1:
+        resources = executor.map(lambda key: repo[uris[key]].read(), uncached)
+        resource_cache.update(zip(uncached, resources))
+    else:
+        for key in uncached:
+            resource_cache[key] = repo[uris[key]].read()
+    return {key: resource_cache[key] for key in uris}
+
+
+def get_model_fields(
+    obj: RDFResourceBase,
+    repo: Repository,
+    prefix: str = '',
+    resource_cache: MutableMapping[str, RepositoryResource] = None,
+    fields: SolrFields = None,
+    executor: Executor = None,
+) -> SolrFields:
     """Iterates over the RDF properties of `obj`, and creates a dictionary of Solr field
     names to values. Adds a `described_by__uri` field containing the "described by" URL for the
     resource at `obj.uri`. For Non-RDF Source resources in Fedora, this will be the resource URI
     followed by the string "/fcr:metadata". For RDF Source resources, this will be the resource
     URI itself. If `obj` is an instance of `plastron.models.ContentModeledResource`, include a
-    `content_model_name__str` field in the results."""
+    `content_model_name__str` field in the results.
+
+    If a `resource_cache` is given, it is used (and passed along to any nested calls) to
+    avoid reading the same repository resource more than once. See `read_resource()`.
+    Similarly, an `executor`, if given, is passed along to `read_resources()`.
+
+    If a `fields` dictionary is given, the fields are added to it (and it is returned)
+    instead of to a new dictionary. The same applies to the `fields` parameter of the
+    other `get_*_fields()` functions and `get_field()`; this lets the whole document be
+    built up in a single dictionary, without creating and merging intermediate ones."""
     logger.info(f'Converting {obj.uri}')
 
-    if isinstance(obj, ContentModeledResource):
-        model_name = obj.__class__.model_name
-        fields = {
-            'content_model_name__str': model_name,
-        }
-    else:
-        model_name = None
+    if fields is None:
         fields = {}
+    if (model_name := get_model_name(type(obj))) is not None:
+        fields['content_model_name__str'] = model_name
+
+    # get the "described by" value for non-fragment resources that are within the repository;
+    # Endpoint containment is a plain string prefix test, so there is no need to parse the URI
+    uri = str(obj.uri)
+    if '#' not in uri and uri in repo.endpoint:
+        resource = read_resource(repo, obj.uri, resource_cache)
+        fields['described_by__uri'] = str(resource.description_url or resource.url)
+
+    resource_language = get_resource_language(obj)
+    debug = logger.debug
+    for plan in get_field_plans(type(obj)):
+        prop = getattr(obj, plan.attr_name)
+        if prop.value is None:
+            # skip properties with no values; unlike len(prop), this stops
+            # at the first value instead of materializing the whole list
+            debug(f'Skipping empty property {plan.attr_name}')
+            continue
+        match plan.kind:
+            case 'data':
+                get_field(prop, base=prefix + plan.attr_name, fields=fields, **plan.field_arguments)
+            case 'text':
+                get_text_fields(prop, prefix, resource_language, fields)
+            case 'object':
+                get_object_fields(prop, repo, prefix, resource_cache, fields, executor)
 
-    # get the "described by" value for non-fragment resources that are within the repository
-    url = URLObject(obj.uri)
-    if url in repo.endpoint and not url.fragment:
-        resource = repo[url].read()
-        fields.update(described_by__uri=str(resource.description_url or resource.url))
+    return fields
 
-    for prop in obj.rdf_properties():
-        if len(prop) == 0:
-            # skip properties with no values
-            logger.debug(f'Skipping empty property {prop.attr_name}')
-            continue
-        if prop.attr_name in SKIP_FIELDS_BY_MODEL.get(model_name, set()):
+
+_model_names: WeakKeyDictionary[type, str | None] = WeakKeyDictionary()
+
+
+def get_model_name(cls: type[RDFResourceBase]) -> str | None:
+    """Returns the `model_name` of `cls` if it is a subclass of
+    `plastron.models.ContentModeledResource`, and `None` otherwise. The
+    result is cached per class."""
+    try:
+        return _model_names[cls]
+    except KeyError:
+        model_name = cls.model_name if issubclass(cls, ContentModeledResource) else None
+        _model_names[cls] = model_name
+        return model_name
+
+
+_field_plans: WeakKeyDictionary[type, tuple[FieldPlan, ...]] = WeakKeyDictionary()
+
+
+def get_field_plans(cls: type[RDFResourceBase]) -> tuple[FieldPlan, ...]:
+    """Returns the `FieldPlan` for each indexable property of the model class
+    `cls`. The plans depend only on the class, so they are computed from the
+    class's property descriptors the first time a class is seen, and then
+    cached. Properties listed in `SKIP_FIELDS_BY_MODEL` for the model are
+    left out, as are properties that are neither data nor object properties."""
+    try:
+        return _field_plans[cls]
+    except KeyError:
+        pass
+
+    model_name = get_model_name(cls)
+    skip_fields = SKIP_FIELDS_BY_MODEL.get(model_name, set())
+    plans = []
+    for attr_name in cls.rdf_property_names:
+        if attr_name in skip_fields:
             # explicitly skip these properties
-            logger.debug(f'Skipping property {prop.attr_name} of model {model_name}')
+            logger.debug(f'Skipping property {attr_name} of model {model_name}')
             continue
-        if isinstance(prop, RDFDataProperty):
-            fields.update(get_data_fields(prop, prefix, get_resource_language(obj)))
-        elif isinstance(prop, RDFObjectProperty):
-            fields.update(get_object_fields(prop, repo, prefix))
-
-    return fields
+        descriptor = getattr(cls, attr_name)
+        if isinstance(descriptor, DataProperty):
+            field_arguments = get_field_arguments(attr_name, descriptor.datatype)
+            if field_arguments is not None:
+                plans.append(FieldPlan(attr_name, 'data', field_arguments))
+            else:
+                plans.append(FieldPlan(attr_name, 'text'))
+        elif isinstance(descriptor, ObjectProperty):
+            plans.append(FieldPlan(attr_name, 'object'))
+
+    _field_plans[cls] = tuple(plans)
+    return _field_plans[cls]
+
+
+def get_field_arguments(attr_name: str, datatype: URIRef | None) -> dict[str, Any] | None:
+    """Returns the `get_field()` arguments for a data property with the given
+    `attr_name` and `datatype`, from `FIELD_ARGUMENTS_BY_DATATYPE` or else from
+    `FIELD_ARGUMENTS_BY_ATTR_NAME`. Returns `None` if the property should be
+    indexed as text."""
+    if (field_arguments := FIELD_ARGUMENTS_BY_DATATYPE.get(datatype)) is not None:
+        # special handling per datatype
+        return field_arguments
+    # special handling per property name
+    return FIELD_ARGUMENTS_BY_ATTR_NAME.get(attr_name)
 
 
 def get_resource_language(obj: ContentModeledResource, prop_name: str = 'language') -> str | None:
@@ -175,21 +429,52 @@ def get_resource_language(obj: ContentModeledResource, prop_name: str = 'languag
     return str(language) if language is not None else None
 
 
-def get_linked_objects(prop: RDFObjectProperty, repo: Repository) -> Iterator[RDFResource]:
+def get_linked_objects(
+    prop: RDFObjectProperty,
+    repo: Repository,
+    resource_cache: MutableMapping[str, RepositoryResource] = None,
+    executor: Executor = None,
+) -> Iterator[RDFResource]:
     """Iterate over the URIs in `prop.values`, retrieving the resource at
-    each URI and returning it described using the `prop.object_class`."""
-    for uri in prop.values:
-        if uri in repo.endpoint:
-            yield repo[uri].read().describe(prop.object_class)
-        elif not issubclass(prop.object_class, VocabularyTerm):
+    each URI and returning it described using the `prop.object_class`.
+    All the resources are retrieved up front, using `read_resources()` with
+    the given `resource_cache` and `executor`, and then described using `describe_resource()`
+    and returned in their original order."""
+    object_class = prop.object_class
+    uris = list(prop.values)
+    resources = read_resources(repo, (uri for uri in uris if uri in repo.endpoint), resource_cache, executor)
+    for uri in uris:
+        if (resource := resources.get(str(uri))) is not None:
+            yield describe_resource(resource, object_class, resource_cache)
+        elif not issubclass(object_class, VocabularyTerm):
             yield uri
 
 
-def get_child_documents(prefix: str, objects: Iterable[RDFResource], repo: Repository) -> list[SolrFields]:
-    """Returns a list containing an index document for each resource in `objects`."""
-    return [{'id': str(o.uri), **get_model_fields(o, repo=repo, prefix=prefix)} for o in objects]
+def get_child_documents(
+    prefix: str,
+    objects: Iterable[RDFResource],
+    repo: Repository,
+    resource_cache: MutableMapping[str, RepositoryResource] = None,
+    executor: Executor = None,
+) -> list[SolrFields]:
+    """Returns a list containing an index document for each resource in `objects`.
+
+    The documents are built one at a time, on the calling thread; only the
+    repository reads they need are submitted to the `executor`, if given."""
+    return [
+        get_model_fields(
+            o,
+            repo=repo,
+            prefix=prefix,
+            resource_cache=resource_cache,
+            fields={'id': str(o.uri)},
+            executor=executor,
+        )
+        for o in objects
+    ]
 
 
+@lru_cache(maxsize=256)
 def language_suffix(language: str | None) -> str:
     """Normalizes the `language` string by:
 
@@ -202,6 +487,9 @@ def language_suffix(language: str | None) -> str:
     Returns the normalized value, prepended with "_". If `language`
     is `None`, returns an empty string instead.
 
+    Results are memoized; since exceptions are not cached, an invalid
+    `language` raises an `IndexerError` on every call.
+
     ```pycon
     >>> language_suffix('en')
     '_en'
@@ -220,7 +508,7 @@ def language_suffix(language: str | None) -> str:
     """
     if language is not None:
         try:
-            return '_' + standardize_tag(language).lower().replace('-', '_')
+            return '_' + _standardize_tag(language).lower().replace('-', '_')
         except LanguageTagError as e:
             logger.error(str(e))
             raise IndexerError(f'Unable to determine language suffix from "{language}"')
@@ -228,7 +516,12 @@ def language_suffix(language: str | None) -> str:
         return ''
 
 
-def get_data_fields(prop: RDFDataProperty, prefix: str = '', resource_language: str = None) -> SolrFields:
+def get_data_fields(
+    prop: RDFDataProperty,
+    prefix: str = '',
+    resource_language: str = None,
+    fields: SolrFields = None,
+) -> SolrFields:
     """Get the dictionary of field key(s) and value(s) for the given data
     property using `get_field()`. All keys are prepended with the given
     `prefix`.
@@ -241,27 +534,44 @@ def get_data_fields(prop: RDFDataProperty, prefix: str = '', resource_language:
     property name followed by "__txt" and then followed by a language suffix,
     as determined by `language_suffix()`.
     """
-    if prop.datatype in FIELD_ARGUMENTS_BY_DATATYPE:
-        # special handling per datatype
-        return get_field(prop, prefix, **FIELD_ARGUMENTS_BY_DATATYPE[prop.datatype])
+    if (field_arguments := get_field_arguments(prop.attr_name, prop.datatype)) is not None:
+        return get_field(prop, base=prefix + prop.attr_name, fields=fields, **field_arguments)
     else:
-        # special handling per property name
-        if prop.attr_name in FIELD_ARGUMENTS_BY_ATTR_NAME:
-            return get_field(prop, prefix, **FIELD_ARGUMENTS_BY_ATTR_NAME[prop.attr_name])
-        else:
-            # everything else is treated as text
-            fields = {}
-            # divide values up by language
-            for language in prop.languages:
-                fields.update(get_field(
-                    prop=prop,
-                    prefix=prefix,
-                    suffix=Suffix('__txt', plural=prop.repeatable, lang=language_suffix(language)),
-                    value_filter=lambda v: v.language == language,
-                ))
-            # add a `__display` field that contains all the values, with embedded language tags
-            fields.update({f'{prefix}{prop.attr_name}__display': get_display_values(prop.values, resource_language)})
-            return fields
+        # everything else is treated as text
+        return get_text_fields(prop, prefix, resource_language, fields)
+
+
+def get_text_fields(
+    prop: RDFDataProperty,
+    prefix: str = '',
+    resource_language: str = None,
+    fields: SolrFields = None,
+) -> SolrFields:
+    """Get the dictionary of text field keys and values for the given data
+    property. There is one "__txt" field per language tag, plus a "__display"
+    field with all the values (see `get_display_values()`). All keys are
+    prepended with the given `prefix`."""
+    base = prefix + prop.attr_name
+    if fields is None:
+        fields = {}
+    repeatable = prop.repeatable
+    # divide values up by language, in a single pass over the values
+    values = []
+    values_by_language: dict[str | None, list[Literal]] = {}
+    for value in prop.values:
+        values.append(value)
+        values_by_language.setdefault(value.language, []).append(value)
+    for language, language_values in values_by_language.items():
+        get_field_from_values(
+            prop=prop,
+            base=base,
+            suffix=get_suffix('__txt', plural=repeatable, lang=language_suffix(language)),
+            values=language_values,
+            fields=fields,
+        )
+    # add a `__display` field that contains all the values, with embedded language tags
+    fields[base + '__display'] = get_display_values(values, resource_language)
+    return fields
 
 
 def get_display_values(values: Iterable[Literal], preferred_language: str = None) -> list[str]:
@@ -274,15 +584,24 @@ def get_display_values(values: Iterable[Literal], preferred_language: str = None
     def _by_language(value: Literal):
         if value.language is None:
             return f'3,{value.casefold()}'
-        elif preferred_language is not None and standardize_tag(value.language) == standardize_tag(preferred_language):
+        elif preferred_language is not None and (
+            _standardize_tag(value.language) == _standardize_tag(preferred_language)
+        ):
             return f'1,{value.casefold()}'
         else:
-            return f'2,{standardize_tag(value.language)},{value.casefold()}'
+            return f'2,{_standardize_tag(value.language)},{value.casefold()}'
 
     return [embed_language_tag(v, '[@{tag}]{value}') for v in sorted(values, key=_by_language)]
 
 
-def get_object_fields(prop: RDFObjectProperty, repo: Repository, prefix: str = '') -> SolrFields:
+def get_object_fields(
+    prop: RDFObjectProperty,
+    repo: Repository,
+    prefix: str = '',
+    resource_cache: MutableMapping[str, RepositoryResource] = None,
+    fields: SolrFields = None,
+    executor: Executor = None,
+) -> SolrFields:
     """Get the dictionary of field key(s) and value(s) for the given object
     property using `get_field()`. All keys are prepended with the given
     `prefix`.
@@ -299,29 +618,51 @@ def get_object_fields(prop: RDFObjectProperty, repo: Repository, prefix: str = '
     a field for that property whose value is a list of the indexing documents
     for those embedded resources. This structure will establish a set of
     nested documents once it is added to Solr.
+
+    The `resource_cache` and `executor`, if given, are passed along to
+    `get_model_fields()` and `get_linked_objects()`.
     """
-    fields = {}
-    fields.update(get_field(prop, prefix, '__uri'))
-    fields.update(get_field(prop, prefix, '__curie', converter=shorten_uri))
-    if prop.object_class is None:
+    base = prefix + prop.attr_name
+    if fields is None:
+        fields = {}
+    # read the values from the graph once, for both the URI and CURIE fields;
+    # shorten_uri() is memoized, so URIs without a known prefix are cheap after
+    # the first time they are seen
+    values = list(prop.values)
+    get_field_from_values(prop, suffix='__uri', values=values, base=base, fields=fields)
+    get_field_from_values(prop, suffix='__curie', values=values, converter=shorten_uri, base=base, fields=fields)
+    object_class = prop.object_class
+    if object_class is None:
         return fields
 
-    if issubclass(prop.object_class, VocabularyTerm):
+    child_prefix = object_class.__name__.lower() + '__'
+    if issubclass(object_class, VocabularyTerm):
         if prop.object is not None:
             # add vocabulary fields
-            fields.update(get_model_fields(prop.object, repo=repo, prefix=prefix + prop.attr_name + '__'))
+            get_model_fields(
+                prop.object,
+                repo=repo,
+                prefix=base + '__',
+                resource_cache=resource_cache,
+                fields=fields,
+                executor=executor,
+            )
     elif prop.embedded:
-        fields[prefix + prop.attr_name] = get_child_documents(
-            prefix=prop.object_class.__name__.lower() + '__',
+        fields[base] = get_child_documents(
+            prefix=child_prefix,
             objects=prop.objects,
             repo=repo,
+            resource_cache=resource_cache,
+            executor=executor,
         )
     else:
         # linked object
-        fields[prefix + prop.attr_name] = get_child_documents(
-            prefix=prop.object_class.__name__.lower() + '__',
-            objects=get_linked_objects(prop, repo),
+        fields[base] = get_child_documents(
+            prefix=child_prefix,
+            objects=get_linked_objects(prop, repo, resource_cache, executor),
             repo=repo,
+            resource_cache=resource_cache,
+            executor=executor,
         )
     return fields
 
@@ -331,31 +672,76 @@ def get_field(
     prefix: str = '',
     suffix: Suffix | str = '__str',
     converter: Callable[[Literal | URIRef], str | int] = str,
-    value_filter: Callable[[Literal | URIRef], bool] = lambda v: True,
+    value_filter: Callable[[Literal | URIRef], bool] | None = None,
+    base: str = None,
+    fields: SolrFields = None,
 ) -> SolrFields:
     """Convert a property to a `{field_name: value(s)}` format dictionary.
 
     If `value_filter` is given, only those values that pass the value filter
-    (i.e., return `True`) are included.
+    (i.e., return `True`) are included. By default, all values are included,
+    without calling a filter function on each one.
 
     If `converter` is given, it is applied to the included values. Should
-    return a `str` or `int`. Default is `str()`."""
+    return a `str` or `int`. Default is `str()`.
+
+    If `base` is given, it is used as the field name before the suffix,
+    instead of concatenating the `prefix` and the property's `attr_name`.
+    Callers that create several fields for the same property can use this
+    to compute that part of the field name only once.
+
+    If `fields` is given, the field is added to that dictionary, which is
+    then returned, instead of to a new dictionary."""
+    return get_field_from_values(
+        prop=prop,
+        prefix=prefix,
+        suffix=suffix,
+        values=prop.values if value_filter is None else filter(value_filter, prop.values),
+        converter=converter,
+        base=base,
+        fields=fields,
+    )
+
+
+def get_field_from_values(
+    prop: RDFProperty,
+    prefix: str = '',
+    suffix: Suffix | str = '__str',
+    values: Iterable[Literal | URIRef] = (),
+    converter: Callable[[Literal | URIRef], str | int] = str,
+    base: str = None,
+    fields: SolrFields = None,
+) -> SolrFields:
+    """Like `get_field()`, but uses the given `values` instead of the values
+    of `prop`. This is useful when the caller has already selected the values
+    for the field, so they do not need to be filtered again. The `prop` is
+    still used to determine the field name and whether it is repeatable."""
 
+    repeatable = prop.repeatable
     if isinstance(suffix, str):
-        suffix = Suffix(suffix, plural=prop.repeatable)
-
-    name = prefix + prop.attr_name + str(suffix)
-    values = [converter(v) for v in prop.values if value_filter(v)]
-    if prop.repeatable:
-        return {name: values}
-    else:
-        return {name: values[0]}
+        suffix = get_suffix(suffix, plural=repeatable)
+
+    if base is None:
+        base = prefix + prop.attr_name
+    name = base + str(suffix)
+    # map() iterates in C, avoiding per-value bytecode dispatch
+    values = list(map(converter, values))
+    if fields is None:
+        fields = {}
+    fields[name] = values if repeatable else values[0]
+    return fields
 
 
+@lru_cache(maxsize=4096)
 def shorten_uri(uri: str) -> str | None:
     """Attempt to shorten `uri` into a CURIE with a known prefix. If no
     such prefix is found, returns the full `uri` string. If `uri` is
-    `None`, returns `None`."""
+    `None`, returns `None`.
+
+    Results are memoized, since the same URIs (e.g., RDF types and
+    authority terms) recur across many resources. In particular, this
+    avoids repeating the failed lookup for URIs with no known prefix,
+    which `namespace_manager` does not cache itself."""
     if uri is None:
         return None
     try:
@@ -382,6 +768,6 @@ def embed_language_tag(value: Literal, template: str = '{value}|{tag}') -> str:
     ```
     """
     if value.language:
-        return template.format(value=value, tag=standardize_tag(value.language))
+        return template.format(value=value, tag=_standardize_tag(value.language))
     else:
         return str(value)
@@ -5,7 +5,7 @@ from uuid import uuid4
 import plastron.models.authorities
 import plastron.validation.vocabularies
 import pytest
-from httpretty import httpretty
+import responses
 from plastron.client import Endpoint, Client
 from plastron.models import ContentModeledResource
 from plastron.repo import RepositoryResource, Repository
@@ -43,7 +43,7 @@ def proxies() -> SolrFields:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def create_mock_repo():
     def _create_mock_repo(
         paths: Mapping[str, ContentModeledResource | tuple[ContentModeledResource, type[RepositoryResource]]] = None,
@@ -78,7 +78,11 @@ def create_mock_repo():
             resource.describe.return_value = obj
             resource.path = path
             resource._graph = obj.graph
-            resource.get_sequence.return_value = ProxiedResourceIterator(resource)
+            # return a fresh iterator on each call, so a mock repo can be shared
+            # between tests without the first one exhausting the sequence
+            resource.get_sequence.side_effect = lambda *_args, _resource=resource, **_kwargs: (
+                ProxiedResourceIterator(_resource)
+            )
             uri_mapping[URIRef(repo_url + path)] = resource
 
         return mock_repo
@@ -130,15 +134,15 @@ def get_mock_context(get_mock_resource):
 @pytest.fixture
 def register_uri_for_reading():
     def _register_uri_for_reading(uri: str, content_type: str, body: str):
-        httpretty.register_uri(
-            method=httpretty.HEAD,
-            uri=uri,
-            adding_headers={'Content-Type': content_type},
+        responses.add(
+            method=responses.HEAD,
+            url=uri,
+            content_type=content_type,
         )
-        httpretty.register_uri(
-            method=httpretty.GET,
-            uri=uri,
+        responses.add(
+            method=responses.GET,
+            url=uri,
             body=body,
-            adding_headers={'Content-Type': content_type},
+            content_type=content_type,
         )
     return _register_uri_for_reading
@@ -1,15 +1,19 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import httpretty
 import pytest
-from plastron.client import Endpoint
+import responses
+from plastron.client import Client, Endpoint
 from plastron.models import ContentModeledResource
 from plastron.models.authorities import Subject, UMD_ARCHIVAL_COLLECTIONS
 from plastron.models.page import File
 from plastron.models.umd import Item
-from plastron.namespaces import umdtype, rdf, xsd, dcterms, owl
-from plastron.rdfmapping.descriptors import DataProperty
+from plastron.namespaces import umdtype, rdf, rdfs, xsd, dcterms, owl
+from plastron.rdfmapping.descriptors import DataProperty, ObjectProperty
+from plastron.rdfmapping.graph import TrackChangesGraph
 from plastron.rdfmapping.properties import RDFDataProperty, RDFObjectProperty
 from plastron.rdfmapping.resources import RDFResource
 from plastron.repo import Repository, RepositoryResource
@@ -25,6 +29,11 @@ from solrizer.indexers.content_model import (
     language_suffix,
     content_model_fields,
     get_display_values,
+    describe_resource,
+    read_resources,
+    get_field_plans,
+    FieldPlan,
+    get_model_name,
 )
 
 
@@ -60,6 +69,13 @@ def test_invalid_language_suffix():
         language_suffix('invalid::tag')
 
 
+def test_invalid_language_suffix_is_not_cached():
+    # exceptions are not memoized, so every call with a bad tag should raise
+    for _ in range(2):
+        with pytest.raises(IndexerError):
+            language_suffix('invalid::tag')
+
+
 @pytest.mark.parametrize(
     ('attr_name', 'datatype', 'repeatable', 'values', 'expected_fields'),
     [
@@ -105,6 +121,18 @@ def test_invalid_language_suffix():
                 'value__display': ['dog', '[@en]dog', '[@de]der Hund'],
             },
         ),
+        # multiple values with the same language are grouped into the same field
+        (
+            'value',
+            None,
+            True,
+            [Literal('dog', lang='en'), Literal('der Hund', lang='de'), Literal('cat', lang='en')],
+            {
+                'value__txts_en': ['dog', 'cat'],
+                'value__txts_de': ['der Hund'],
+                'value__display': ['[@de]der Hund', '[@en]cat', '[@en]dog'],
+            },
+        ),
     ],
 )
 def test_get_data_properties(attr_name, datatype, repeatable, values, expected_fields):
@@ -129,6 +157,20 @@ def test_get_data_properties(attr_name, datatype, repeatable, values, expected_f
             assert v == expected_fields[k]
 
 
+def test_get_data_fields_into_existing_dict():
+    resource = RDFResource(uri='http://example.com/fcrepo/foo')
+    prop = RDFDataProperty(resource=resource, attr_name='title', predicate=dcterms.title)
+    prop.add(Literal('Foobar'))
+    fields = {'id': 'http://example.com/fcrepo/foo'}
+    result = get_data_fields(prop, fields=fields)
+    assert result is fields
+    assert fields == {
+        'id': 'http://example.com/fcrepo/foo',
+        'title__txt': 'Foobar',
+        'title__display': ['Foobar'],
+    }
+
+
 def test_object_property_simple_no_curie():
     resource = RDFResource(uri='http://example.com/fcrepo/foo')
     prop = RDFObjectProperty(
@@ -245,6 +287,104 @@ def test_object_property_linked():
     }]
 
 
+def test_object_property_linked_with_resource_cache():
+    resource = RDFResource(uri='http://example.com/fcrepo/foo')
+    prop = RDFObjectProperty(
+        resource=resource,
+        attr_name='subject',
+        predicate=dcterms.subject,
+        object_class=Subject,
+    )
+    prop.add(URIRef('http://example.com/fcrepo/foo/bar'))
+    repo = MagicMock(spec=Repository)
+    repo.endpoint = Endpoint(url='http://example.com/fcrepo')
+    repo_resource = MagicMock(
+        spec=RepositoryResource,
+        url='http://example.com/fcrepo/foo/bar',
+        description_url=None,
+    )
+    repo.__getitem__.return_value = repo_resource
+    repo_resource.read.return_value = repo_resource
+    repo_resource.describe.return_value = Subject(
+        uri=URIRef('http://example.com/fcrepo/foo/bar'),
+        label=Literal('Bar'),
+    )
+    resource_cache = {}
+    get_object_fields(prop, repo, resource_cache=resource_cache)
+    get_object_fields(prop, repo, resource_cache=resource_cache)
+    # the linked resource is read once, and reused for its "described by" lookup
+    # and for the second property conversion
+    repo.__getitem__.assert_called_once_with(URIRef('http://example.com/fcrepo/foo/bar'))
+    # and described once
+    repo_resource.describe.assert_called_once_with(Subject)
+    assert resource_cache == {
+        'http://example.com/fcrepo/foo/bar': repo_resource,
+        ('http://example.com/fcrepo/foo/bar', 'descriptions'): {Subject: repo_resource.describe.return_value},
+    }
+
+
+def test_describe_resource():
+    uri = 'http://example.com/fcrepo/foo'
+    graph = TrackChangesGraph().parse(data=f'<{uri}> <{rdfs.label}> "Foo" .', format='nt')
+    resource = MagicMock(spec=RepositoryResource, url=uri, graph=graph)
+    resource.describe.side_effect = lambda cls: cls(uri=URIRef(uri), graph=graph)
+    resource_cache = {}
+    item = describe_resource(resource, Item, resource_cache)
+    # descriptions are memoized per class
+    assert describe_resource(resource, Item, resource_cache) is item
+    assert item.graph is graph
+    # other classes describe a copy of the original graph, without the Item types
+    subject = describe_resource(resource, Subject, resource_cache)
+    assert subject.graph is not graph
+    assert subject.label.value == Literal('Foo')
+    assert set(subject.graph.objects(URIRef(uri), rdf.type)).isdisjoint(graph.objects(URIRef(uri), rdf.type))
+    resource.describe.assert_called_once_with(Item)
+
+
+@pytest.mark.parametrize('use_executor', [False, True])
+def test_read_resources(get_mock_resource, use_executor):
+    uris = [URIRef(f'http://example.com/fcrepo/{n}') for n in range(5)]
+    cached_resource = get_mock_resource('/0', None)
+    resource_cache = {str(uris[0]): cached_resource}
+    repo = MagicMock(spec=Repository)
+    repo.__getitem__.side_effect = lambda uri: get_mock_resource(uri, None)
+    with ThreadPoolExecutor(max_workers=2) if use_executor else nullcontext() as executor:
+        resources = read_resources(repo, uris, resource_cache, executor)
+    assert list(resources.keys()) == [str(uri) for uri in uris]
+    assert resources[str(uris[0])] is cached_resource
+    assert [r.path for r in resources.values()][1:] == uris[1:]
+    # only the uncached resources are read from the repository
+    assert repo.__getitem__.call_count == 4
+    assert resource_cache == resources
+
+
+def test_object_property_linked_concurrent_reads():
+    uris = [URIRef(f'http://example.com/fcrepo/subject/{n}') for n in range(6)]
+    resource = RDFResource(uri='http://example.com/fcrepo/foo')
+    prop = RDFObjectProperty(
+        resource=resource,
+        attr_name='subject',
+        predicate=dcterms.subject,
+        object_class=Subject,
+    )
+    for uri in uris:
+        prop.add(uri)
+    repo = Repository(client=Client(endpoint=Endpoint(url='http://example.com/fcrepo')))
+    with responses.RequestsMock() as mock, ThreadPoolExecutor(max_workers=4) as executor:
+        for n, uri in enumerate(uris):
+            mock.add(responses.HEAD, str(uri), content_type='application/n-triples')
+            mock.add(
+                responses.GET,
+                str(uri),
+                body=f'<{uri}> <{rdfs.label}> "Subject {n}" .',
+                content_type='application/n-triples',
+            )
+        fields = get_object_fields(prop, repo, resource_cache={}, executor=executor)
+    # documents are in the original order, even though the reads were concurrent
+    assert [doc['id'] for doc in fields['subject']] == [str(uri) for uri in uris]
+    assert [doc['subject__label__txt'] for doc in fields['subject']] == [f'Subject {n}' for n in range(6)]
+
+
 @pytest.mark.parametrize(
     ('obj', 'prefix', 'expected_fields'),
     [
@@ -357,6 +497,66 @@ def test_described_by(url, description_url, expected_value):
     assert fields['described_by__uri'] == expected_value
 
 
+class LinkingResource(ContentModeledResource):
+    model_name = 'LinkingResource'
+    subject = ObjectProperty(dcterms.subject, repeatable=True, cls=Subject)
+
+
+@pytest.mark.parametrize('read_workers', [1, 4])
+def test_content_model_fields_read_workers(read_workers):
+    uri = 'http://example.com/fcrepo/foo'
+    subject_uris = [f'http://example.com/fcrepo/subject/{n}' for n in range(6)]
+    repo = Repository(client=Client(endpoint=Endpoint(url='http://example.com/fcrepo')))
+    with (
+        responses.RequestsMock() as mock,
+        patch('solrizer.indexers.content_model.ThreadPoolExecutor', wraps=ThreadPoolExecutor) as executor_class,
+    ):
+        mock.add(responses.HEAD, uri, content_type='application/n-triples')
+        mock.add(
+            responses.GET,
+            uri,
+            body='\n'.join(f'<{uri}> <{dcterms.subject}> <{subject_uri}> .' for subject_uri in subject_uris),
+            content_type='application/n-triples',
+        )
+        for n, subject_uri in enumerate(subject_uris):
+            mock.add(responses.HEAD, subject_uri, content_type='application/n-triples')
+            mock.add(
+                responses.GET,
+                subject_uri,
+                body=f'<{subject_uri}> <{rdfs.label}> "Subject {n}" .',
+                content_type='application/n-triples',
+            )
+        context = IndexerContext(
+            repo=repo,
+            resource=repo[uri].read(),
+            model_class=LinkingResource,
+            doc={'id': uri},
+            config={},
+            settings={'read_workers': read_workers},
+        )
+        fields = content_model_fields(context)
+    if read_workers > 1:
+        executor_class.assert_called_once_with(max_workers=read_workers)
+    else:
+        executor_class.assert_not_called()
+    assert [doc['id'] for doc in fields['object__subject']] == subject_uris
+    assert [doc['subject__label__txt'] for doc in fields['object__subject']] == [f'Subject {n}' for n in range(6)]
+
+
+@pytest.mark.parametrize('read_workers', ['abc', 0, -1, None])
+def test_content_model_fields_invalid_read_workers(read_workers):
+    context = IndexerContext(
+        repo=MagicMock(spec=Repository),
+        resource=MagicMock(spec=RepositoryResource),
+        model_class=BasicResource,
+        doc={'id': 'foo'},
+        config={},
+        settings={'read_workers': read_workers},
+    )
+    with pytest.raises(IndexerError):
+        content_model_fields(context)
+
+
 @pytest.mark.parametrize(
     ('values', 'preferred_language', 'expected_value'),
     [
@@ -423,3 +623,34 @@ def test_get_model_fields_display_value_without_resource_language():
     obj = SimpleModel(title=[Literal('Hund', lang='de'), Literal('Dog', 'en')])
     fields = get_model_fields(obj, mock_repo)
     assert fields['title__display'] == ['[@de]Hund', '[@en]Dog']
+
+
+def test_get_field_plans():
+    assert sorted(get_field_plans(SimpleModel), key=lambda plan: plan.attr_name) == [
+        FieldPlan('language', 'text'),
+        FieldPlan('title', 'text'),
+    ]
+    # plans are cached per class
+    assert get_field_plans(SimpleModel) is get_field_plans(SimpleModel)
+
+
+def test_get_field_plans_skip_fields():
+    plans = {plan.attr_name: plan for plan in get_field_plans(Item)}
+    assert 'first' not in plans
+    assert plans['handle'] == FieldPlan('handle', 'data', {'suffix': '__id'})
+    assert plans['identifier'] == FieldPlan('identifier', 'data', {'suffix': '__id'})
+    assert plans['title'].kind == 'text'
+    assert plans['subject'].kind == 'object'
+
+
+@pytest.mark.parametrize(
+    ('cls', 'expected_value'),
+    [
+        (SimpleModel, 'SimpleModel'),
+        (Item, 'Item'),
+        (Subject, None),
+        (RDFResource, None),
+    ]
+)
+def test_get_model_name(cls, expected_value):
+    assert get_model_name(cls) == expected_value
@@ -24,6 +24,14 @@ def test_iiif_identifier(path, prefix, expected_identifier):
     assert iiif_identifier(path, prefix) == expected_identifier
 
 
+@pytest.fixture(scope='module')
+def iiif_mock_context():
+    # read-only across the parametrized cases, so build it (and the
+    # spec-based mock) only once per module
+    repo = Repository(client=Client(endpoint=Endpoint('http://example.com/fcrepo/rest')))
+    return MagicMock(spec=IndexerContext, config={'IIIF_IDENTIFIER_PREFIX': 'fcrepo:'}, repo=repo)
+
+
 @pytest.mark.parametrize(
     ('files', 'expected_id'),
     [
@@ -110,7 +118,7 @@ def test_iiif_identifier(path, prefix, expected_identifier):
         ),
     ]
 )
-def test_get_file_identifier(files, expected_id):
+def test_get_file_identifier(files, expected_id, iiif_mock_context):
     page = {
         'page__has_file': [
             {
@@ -121,17 +129,14 @@ def test_get_file_identifier(files, expected_id):
             for repo_path, rdf_types, mime_type in files
         ]
     }
-    mock_context = MagicMock(
-        spec=IndexerContext,
-        config={'IIIF_IDENTIFIER_PREFIX': 'fcrepo:'},
-        repo=Repository(client=Client(endpoint=Endpoint('http://example.com/fcrepo/rest'))),
-    )
-    iiif_id = get_first_file_identifier(mock_context, page)
+    iiif_id = get_first_file_identifier(iiif_mock_context, page)
     assert iiif_id == expected_id
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def mock_repo(create_mock_repo):
+    # the tests only read from this repo, so its Proxy/Item/LDPContainer
+    # graphs are built once and shared by every test in this module
     return create_mock_repo({
         '/proxy1': Proxy(proxy_for=URIRef('/url1'), next=URIRef('/proxy2')),
         '/proxy2': Proxy(proxy_for=URIRef('/url2'), next=URIRef('/proxy3')),
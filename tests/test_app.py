@@ -4,15 +4,60 @@ import logging
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-import httpretty
+import responses
 import pytest
 from plastron.client import Client, Endpoint
 from plastron.repo import Repository, RepositoryError, RepositoryResource
 
 from solrizer.errors import BadIndexersParameter
+from solrizer.indexers import IndexerContext
 from solrizer.web import parse_indexers_param
 
 
+@pytest.fixture(scope='session')
+def item_nt_body() -> str:
+    # read directly rather than via the function-scoped datadir fixture,
+    # so the file is only read once per session
+    return (Path(__file__).parent / 'test_app' / 'item.nt').read_text()
+
+
+@pytest.fixture(scope='module')
+def fcrepo_mock():
+    # the HEAD response for the test resource is registered only once per
+    # module; the mock itself is only started for the duration of each test
+    # that uses register_get_body(), and since a test run may select any
+    # subset of those tests, unfired responses are not an error
+    mock = responses.RequestsMock(assert_all_requests_are_fired=False)
+    mock.add(
+        method=responses.HEAD,
+        url='http://example.com/fcrepo/foo',
+        content_type='application/n-triples',
+    )
+    yield mock
+    mock.reset()
+
+
+@pytest.fixture
+def register_get_body(fcrepo_mock):
+    registered = []
+
+    def _register_get_body(uri: str, content_type: str, body: str):
+        registered.append(fcrepo_mock.add(
+            method=responses.GET,
+            url=uri,
+            body=body,
+            content_type=content_type,
+        ))
+
+    fcrepo_mock.start()
+    try:
+        yield _register_get_body
+    finally:
+        fcrepo_mock.stop()
+        for response in registered:
+            fcrepo_mock.remove(response)
+
+
 @pytest.fixture
 def repo():
     return Repository(client=Client(endpoint=Endpoint(url='http://example.com/fcrepo')))
@@ -44,15 +89,14 @@ def test_doc_repository_error(mock_get_repo, app, client):
     assert detail['details'] == 'Resource at "http://example.com/fcrepo/foo" is not available from the repository.'
 
 
-@httpretty.activate()
 @patch('solrizer.web.get_repo')
-def test_doc_content_model_indexer_only(mock_get_repo, monkeypatch, client, datadir: Path, register_uri_for_reading):
+def test_doc_content_model_indexer_only(mock_get_repo, monkeypatch, client, item_nt_body, register_get_body):
     mock_get_repo.return_value = Repository(client=Client(endpoint=Endpoint(url='http://example.com/fcrepo')))
     monkeypatch.setitem(client.application.config, "INDEXERS", {'__default__': ['content_model']})
-    register_uri_for_reading(
+    register_get_body(
         uri='http://example.com/fcrepo/foo',
         content_type='application/n-triples',
-        body=(datadir / 'item.nt').read_text(),
+        body=item_nt_body,
     )
     response = client.get('/doc?uri=http://example.com/fcrepo/foo')
     assert response.status_code == 200
@@ -62,11 +106,31 @@ def test_doc_content_model_indexer_only(mock_get_repo, monkeypatch, client, data
     assert result['content_model_name__str'] == 'Item'
 
 
-@httpretty.activate()
 @patch('solrizer.web.get_repo')
-def test_doc_no_content_model(mock_get_repo, client, repo, register_uri_for_reading):
+def test_doc_serialization_error(mock_get_repo, client, repo, item_nt_body, register_get_body):
+    mock_get_repo.return_value = repo
+    register_get_body(
+        uri='http://example.com/fcrepo/foo',
+        content_type='application/n-triples',
+        body=item_nt_body,
+    )
+    # integers outside the 64-bit range cannot be serialized by orjson
+    with patch.object(IndexerContext, 'run', return_value={'id': 'http://example.com/fcrepo/foo', 'foo__int': 2 ** 64}):
+        response = client.get('/doc?uri=http://example.com/fcrepo/foo')
+    assert response.status_code == 500
+    assert response.mimetype == 'application/problem+json'
+    detail = response.json
+    assert detail['status'] == 500
+    assert detail['title'] == 'Document serialization error'
+    assert detail['details'] == (
+        'The index document for "http://example.com/fcrepo/foo" could not be serialized as JSON.'
+    )
+
+
+@patch('solrizer.web.get_repo')
+def test_doc_no_content_model(mock_get_repo, client, repo, register_get_body):
     mock_get_repo.return_value = repo
-    register_uri_for_reading(
+    register_get_body(
         uri='http://example.com/fcrepo/foo',
         content_type='application/n-triples',
         body='',
@@ -80,14 +144,13 @@ def test_doc_no_content_model(mock_get_repo, client, repo, register_uri_for_read
     assert detail['details'] == 'Resource at "http://example.com/fcrepo/foo" is not available from the repository.'
 
 
-@httpretty.activate()
 @patch('solrizer.web.get_repo')
-def test_doc_with_add_command(mock_get_repo, datadir, client, repo, register_uri_for_reading):
+def test_doc_with_add_command(mock_get_repo, client, repo, item_nt_body, register_get_body):
     mock_get_repo.return_value = repo
-    register_uri_for_reading(
+    register_get_body(
         uri='http://example.com/fcrepo/foo',
         content_type='application/n-triples',
-        body=(datadir / 'item.nt').read_text(),
+        body=item_nt_body,
     )
     response = client.get('/doc?uri=http://example.com/fcrepo/foo&command=add')
     assert response.status_code == 200
@@ -100,16 +163,15 @@ def test_doc_with_add_command(mock_get_repo, datadir, client, repo, register_uri
     assert doc['content_model_name__str'] == 'Item'
 
 
-@httpretty.activate()
 @patch('solrizer.web.get_repo')
-def test_doc_with_update_command(mock_get_repo, datadir, client, repo, register_uri_for_reading):
+def test_doc_with_update_command(mock_get_repo, client, repo, item_nt_body, register_get_body):
     mock_get_repo.return_value = repo
-    register_uri_for_reading(
+    register_get_body(
         uri='http://example.com/fcrepo/foo',
         content_type='application/n-triples',
-        body=(datadir / 'item.nt').read_text(),
+        body=item_nt_body,
     )
-    register_uri_for_reading(
+    register_get_body(
         uri='http://solr.example.com/fcrepo/select',
         content_type='application/json',
         body=json.dumps({
@@ -133,14 +195,13 @@ def test_doc_with_update_command(mock_get_repo, datadir, client, repo, register_
     assert doc['content_model_name__str'] == {'set': 'Item'}
 
 
-@httpretty.activate()
-def test_doc_with_update_command_no_solr_endpoint(datadir, client, repo, register_uri_for_reading):
-    register_uri_for_reading(
+def test_doc_with_update_command_no_solr_endpoint(client, repo, item_nt_body, register_get_body):
+    register_get_body(
         uri='http://example.com/fcrepo/foo',
         content_type='application/n-triples',
-        body=(datadir / 'item.nt').read_text(),
+        body=item_nt_body,
     )
-    register_uri_for_reading(
+    register_get_body(
         uri='http://solr.example.com/fcrepo/select',
         content_type='application/json',
         body=json.dumps({
@@ -163,12 +224,11 @@ def test_doc_with_update_command_no_solr_endpoint(datadir, client, repo, registe
     assert detail['details'] == 'The server is incorrectly configured.'
 
 
-@httpretty.activate()
-def test_doc_with_unknown_command(datadir, client, repo, register_uri_for_reading):
-    register_uri_for_reading(
+def test_doc_with_unknown_command(client, repo, item_nt_body, register_get_body):
+    register_get_body(
         uri='http://example.com/fcrepo/foo',
         content_type='application/n-triples',
-        body=(datadir / 'item.nt').read_text(),
+        body=item_nt_body,
     )
     client.application.config['repo'] = repo
     response = client.get('/doc?uri=http://example.com/fcrepo/foo&command=NOT_A_VALID_COMMAND')
@@ -198,7 +258,6 @@ def test_parse_indexers_param(identifiers_param, expected):
         assert parse_indexers_param(identifiers_param) == e
 
 
-@httpretty.activate()
 def test_doc_with_empty_indexers_param(client):
     response = client.get('/doc?uri=http://example.com/fcrepo/foo&indexers=')
 
@@ -210,7 +269,6 @@ def test_doc_with_empty_indexers_param(client):
     assert detail['details'] == 'No indexers found in ""'
 
 
-@httpretty.activate()
 def test_doc_with_unknown_indexer(client):
     response = client.get('/doc?uri=http://example.com/fcrepo/foo&indexers=NOT_A_VALID_INDEXER')
 
@@ -222,7 +280,6 @@ def test_doc_with_unknown_indexer(client):
     assert detail['details'] == '"NOT_A_VALID_INDEXER" is not a recognized indexer.'
 
 
-@httpretty.activate()
 def test_doc_with_duplicate_indexers(client):
     response = client.get('/doc?uri=http://example.com/fcrepo/foo&indexers=content_model,dates,content_model')
 
@@ -234,16 +291,15 @@ def test_doc_with_duplicate_indexers(client):
     assert detail['details'] == '"content_model,dates,content_model" has duplicate indexers.'
 
 
-@httpretty.activate()
 @patch('solrizer.web.get_repo')
-def test_doc_with_single_indexer(mock_get_repo, datadir, client, repo, register_uri_for_reading, caplog):
+def test_doc_with_single_indexer(mock_get_repo, client, repo, item_nt_body, register_get_body, caplog):
     mock_get_repo.return_value = repo
     caplog.set_level(logging.INFO)
 
-    register_uri_for_reading(
+    register_get_body(
         uri='http://example.com/fcrepo/foo',
         content_type='application/n-triples',
-        body=(datadir / 'item.nt').read_text(),
+        body=item_nt_body,
     )
 
     response = client.get('/doc?uri=http://example.com/fcrepo/foo&indexers=content_model')
@@ -257,16 +313,15 @@ def test_doc_with_single_indexer(mock_get_repo, datadir, client, repo, register_
     assert result['content_model_name__str'] == 'Item'
 
 
-@httpretty.activate()
 @patch('solrizer.web.get_repo')
-def test_doc_with_multiple_indexers(mock_get_repo, datadir, client, repo, register_uri_for_reading, caplog):
+def test_doc_with_multiple_indexers(mock_get_repo, client, repo, item_nt_body, register_get_body, caplog):
     mock_get_repo.return_value = repo
     caplog.set_level(logging.INFO)
 
-    register_uri_for_reading(
+    register_get_body(
         uri='http://example.com/fcrepo/foo',
         content_type='application/n-triples',
-        body=(datadir / 'item.nt').read_text(),
+        body=item_nt_body,
     )
 
     response = client.get('/doc?uri=http://example.com/fcrepo/foo&indexers=content_model,facets')
@@ -1,6 +1,6 @@
 import json
 
-import httpretty
+import responses
 import pytest
 
 from solrizer.solr import atomic_diff, create_atomic_update
@@ -71,7 +71,7 @@ def test_atomic_diff(old_doc, new_doc, expected_diff):
     assert atomic_diff(old_doc, new_doc) == expected_diff
 
 
-@httpretty.activate()
+@responses.activate
 def test_create_atomic_update_no_old_doc(register_uri_for_reading):
     register_uri_for_reading(
         uri='http://solr.example.com/fcrepo/select',